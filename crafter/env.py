@@ -62,6 +62,9 @@ class Env(BaseClass):
     self._players = [None] * self.n_players
     self._last_healths = [None] * self.n_players
     self._last_inventory = [None] * self.n_players
+    # (player_id, unit) -> (inventory items, rendered item view); inventories
+    # change far less often than frames are rendered
+    self._item_view_cache = {}
     
     # Some libraries expect these attributes to be set.
     self.reward_range = None
@@ -281,14 +284,19 @@ class Env(BaseClass):
     return curr_player_reward, is_alive
     #return curr_player_reward, curr_unlocked, is_alive
 
-  def render_one_player(self, player_id, size=None):
+  def render_one_player(self, player_id, size=None, out=None):
     size = size or self._size
     unit = size // self._view
-    canvas = np.zeros(tuple(size) + (3,), np.uint8)
+    if out is None:
+      canvas = np.zeros(tuple(size) + (3,), np.uint8)
+    else:
+      # Reuse a caller-owned (W, H, 3) uint8 buffer instead of allocating
+      canvas = out
+      canvas.fill(0)
     
     curr_player = self._players[player_id]
     local_view = self._local_view(curr_player, unit)
-    item_view = self._item_view(curr_player.inventory, unit)
+    item_view = self._cached_item_view(player_id, curr_player.inventory, unit)
     view = np.concatenate([local_view, item_view], 1)
     
     border = (size - (size // self._view) * self._view) // 2
@@ -296,10 +304,21 @@ class Env(BaseClass):
     canvas[x: x + w, y: y + h] = view
     return canvas.transpose((1, 0, 2))
   
-  def render_all(self, size=None):
+  def _cached_item_view(self, player_id, inventory, unit):
+    # Item slots follow inventory order, so the ordered items are the key.
+    key = (player_id, tuple(unit))
+    items = tuple(inventory.items())
+    cached = self._item_view_cache.get(key)
+    if cached is None or cached[0] != items:
+      cached = (items, self._item_view(inventory, unit))
+      self._item_view_cache[key] = cached
+    return cached[1]
+  
+  def render_all(self, size=None, out=None):
     self.canvases = []
     for player_id in range(len(self._players)):
-      self.canvases.append(self.render_one_player(player_id, size))    
+      player_out = None if out is None else out[player_id]
+      self.canvases.append(self.render_one_player(player_id, size, player_out))
     return self.canvases
   
   def render(self, size=None):
@@ -66,22 +66,20 @@ class PathFinding:
             # Target item not in grid at all
             return None
 
-        min_distance = float('inf')
-        closest_node = None
-        for node in closed_set:
-            for target_pos in target_positions:
-                distance = abs(node[0] - target_pos[0]) + abs(node[1] - target_pos[1])
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_node = node
+        # Manhattan distance from every explored node to its nearest target,
+        # computed in blocks to bound the size of the broadcast array
+        nodes = np.array(list(closed_set))
+        min_distances = np.empty(len(nodes), dtype=np.int64)
+        for i in range(0, len(nodes), 256):
+            block = nodes[i:i + 256]
+            min_distances[i:i + 256] = np.abs(block[:, None, :] - target_positions[None, :, :]).sum(axis=2).min(axis=1)
+        # argmin keeps the first closest node in set order, as the scalar loop did
+        closest_node = tuple(int(v) for v in nodes[min_distances.argmin()])
 
-        if closest_node is not None:
-            path = self.generate_path(parent, closest_node)
-            np_path = np.array(path)
-            movements = np_path[1:] - np_path[:-1]
-            return [self.directions[tuple(move)] for move in movements]
-        else:
-            return None
+        path = self.generate_path(parent, closest_node)
+        np_path = np.array(path)
+        movements = np_path[1:] - np_path[:-1]
+        return [self.directions[tuple(move)] for move in movements]
 
 if __name__ == '__main__':
     # Example usage with 2D numpy array:
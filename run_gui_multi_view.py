@@ -6,6 +6,10 @@ Multi-view GUI for HumanAgent integration with perspective switching
 import argparse
 import sys
 import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 import numpy as np
@@ -25,26 +29,36 @@ from utils import AgentActionProcessor, EnvironmentManager, SimulationLogger, Ag
 class MultiViewGUI:
     """Multi-view GUI class with perspective switching"""
     
+    # Every instance attribute is declared here; slot access is cheaper than a
+    # __dict__ lookup on the per-step and per-frame paths
+    __slots__ = (
+        # Simulation
+        'human_agent_ids', 'n_players', 'max_steps', 'agents', 'env',
+        'action_processor', 'env_manager', 'reporter', 'agent_state_manager',
+        'simulation_context_manager', 'agent_thinking_processor',
+        # GUI and view state
+        'current_step', 'running', 'paused', 'current_human_agent', 'waiting_for_human_input',
+        'input_mode', 'input_prompt', 'input_field', '_input_buf', '_human_skill_draft', 'input_type', 'show_help',
+        'current_view_mode', 'current_followed_agent', 'view_layout',
+        # Pygame setup and cached drawing resources
+        'window_size', 'game_area_size', 'sidebar_width', 'fps', 'render_fps', 'screen', 'clock',
+        'colors', 'fonts', '_text_cache', '_dirty', '_background_dirty', '_full_redraw', '_background',
+        '_dirty_rects', '_view_rects', '_dim_overlay', 'keymap', 'buttons', 'progress_bar_rect', '_sidebar_bg',
+        '_hovered_button_id', '_agent_status_cache', 'help_lines', '_help_overlay_surface',
+        '_button_grid_origin', '_button_grid_pitch', '_button_grid', '_buttons_bounds',
+        '_scanned_button_ids',
+        # Threads, frame buffers and agent state arrays
+        '_frame_lock', '_env_buffers', '_view_surfaces', '_buf_idx',
+        '_frames_updated', '_sidebar_snapshot', '_human_skill_updates', '_sim_thread', '_sim_error', '_thinking_pool', '_pending_futures',
+        '_backend_ready', '_backend_error', '_agent_soa', '_soa_strings', '_soa_string_ids',
+        '_human_agent_indices'
+    )
+    
     def __init__(self, human_agent_ids=None, n_players=3, max_steps=350):
         self.human_agent_ids = human_agent_ids or []
         self.n_players = n_players
         self.max_steps = max_steps
         
-        # Initialize agents
-        self.agents = initialize_agents(human_agent_ids=human_agent_ids, n_players=n_players)
-        
-        # Initialize environment
-        self.env = crafter.Env(length=max_steps, n_players=n_players, seed=4)
-        self.env.reset()
-        
-        # Initialize processors
-        self.action_processor = AgentActionProcessor()
-        self.env_manager = EnvironmentManager()
-        self.reporter = SimulationLogger()
-        self.agent_state_manager = AgentStateManager()
-        self.simulation_context_manager = SimulationContextManager(n_players)
-        self.agent_thinking_processor = AgentThinkingProcessor()
-        
         # GUI state
         self.current_step = 0
         self.running = True
@@ -54,7 +68,10 @@ class MultiViewGUI:
         self.input_mode = False
         self.input_prompt = ""
         self.input_field = ""
+        self._input_buf = []  # Typed characters; joined into input_field when read
+        self._human_skill_draft = []  # op and resources entered so far in the input dialog
         self.input_type = ""
+        self.show_help = False
         
         # View state
         self.current_view_mode = "single"  # "single", "multi", "overview"
@@ -65,9 +82,10 @@ class MultiViewGUI:
         self.window_size = (1400, 900)
         self.game_area_size = (600, 600)
         self.sidebar_width = 400
-        self.fps = 5
+        self.fps = 5  # Simulation steps per second
+        self.render_fps = 30
         pygame.init()
-        self.screen = pygame.display.set_mode(self.window_size)
+        self.screen = pygame.display.set_mode(self.window_size, pygame.DOUBLEBUF)
         self.clock = pygame.time.Clock()
         
         # Colors
@@ -86,6 +104,65 @@ class MultiViewGUI:
             'cyan': (0, 255, 255)
         }
         
+        # Fonts are built once; constructing them reparses the font file
+        self.fonts = {
+            'small': pygame.font.Font(None, 18),
+            'normal': pygame.font.Font(None, 20),
+            'medium': pygame.font.Font(None, 24),
+            'large': pygame.font.Font(None, 36)
+        }
+        # Rendered surfaces for static and low-churn strings, keyed by (text, font_key, color)
+        self._text_cache = {}
+        
+        # Redraw tracking: _dirty requests a new frame, _background_dirty also
+        # rebuilds the cached views/sidebar/buttons beneath the input overlay,
+        # and _full_redraw pushes the whole screen rather than just the areas a
+        # simulation step changes
+        self._dirty = True
+        self._background_dirty = True
+        self._full_redraw = True
+        self._background = pygame.Surface(self.window_size).convert()
+        self._dirty_rects = []  # Screen areas redrawn this frame, pushed with display.update
+        self._view_rects = []  # Screen areas drawn by the agent views in the last background render
+        
+        # Semi-transparent layer dimming the screen behind overlays
+        self._dim_overlay = pygame.Surface(self.window_size).convert()
+        self._dim_overlay.set_alpha(128)
+        self._dim_overlay.fill(self.colors['black'])
+        
+        # Simulation thread state: the sim thread owns stepping and the agents and
+        # env, the main thread only handles events and renders the latest published
+        # frames and sidebar snapshot
+        # Agent views are double buffered: the sim thread renders into the back
+        # buffer and swaps it to the front under _frame_lock; the render thread
+        # only reads the front buffer while holding the same lock
+        self._frame_lock = threading.Lock()
+        # Buffers are (n_players, H, W, 3) so each view is C-contiguous RGB rows;
+        # the env is handed the transposed (W, H, 3) views it renders into
+        self._env_buffers = [
+            np.zeros((n_players,) + self.game_area_size[::-1] + (3,), dtype=np.uint8)
+            for _ in range(2)
+        ]
+        # Surfaces wrapping the buffer memory directly, no per-frame copy or allocation
+        self._view_surfaces = [
+            [pygame.image.frombuffer(buffer[i], self.game_area_size, 'RGB') for i in range(n_players)]
+            for buffer in self._env_buffers
+        ]
+        self._buf_idx = 0  # Index of the front buffer
+        self._frames_updated = False
+        # (step, copy of the SoA arrays) read by render_sidebar, swapped in under _frame_lock
+        self._sidebar_snapshot = None
+        # Skills entered through the input dialog, applied by the sim thread between steps
+        self._human_skill_updates = deque()
+        self._sim_thread = None
+        self._sim_error = None  # Exception that stopped the sim thread, re-raised by run()
+        
+        # Agent thinking runs on worker threads, one in-flight thought per agent
+        self._thinking_pool = ThreadPoolExecutor(max_workers=n_players)
+        # agent id -> future of its thought; pending agents idle with their
+        # experience and step held fixed until their response is applied
+        self._pending_futures = {}
+        
         # Key mappings
         self.keymap = {
             pygame.K_a: 'move_left',
@@ -109,14 +186,116 @@ class MultiViewGUI:
         # UI buttons
         self.buttons = self.create_buttons()
         
-        print('Multi-View GUI Controls:')
-        print('  h: Human agent action selection')
-        print('  p: Pause/Resume simulation')
-        print('  v: Switch view mode (single/multi/overview)')
-        print('  l: Switch layout (horizontal/vertical/grid)')
-        print('  0-9: Follow specific agent (in single view)')
-        print('  ESC: Quit')
-        print('  Mouse: Click buttons for actions')
+        # Static sidebar chrome, drawn once
+        self.progress_bar_rect = pygame.Rect(10, 170, 300, 20)  # Relative to the sidebar
+        self._sidebar_bg = self.create_sidebar_background()
+        self._hovered_button_id = None  # Updated from MOUSEMOTION events
+        self._agent_status_cache = {}  # agent index -> (status key, rendered surface)
+        
+        self.help_lines = [
+            'Multi-View GUI Controls:',
+            '  h: Human agent action selection',
+            '  p: Pause/Resume simulation',
+            '  v: Switch view mode (single/multi/overview)',
+            '  l: Switch layout (horizontal/vertical/grid)',
+            '  0-9: Follow specific agent (in single view)',
+            '  ESC: Quit',
+            '  Mouse: Click buttons for actions'
+        ]
+        for line in self.help_lines:
+            print(line)
+        
+        # The help overlay is fully static, so it is baked into one surface
+        self._help_overlay_surface = self.create_help_overlay()
+        
+        # Agents and environment are built off the main thread behind a loading splash
+        self._backend_ready = threading.Event()
+        self._backend_error = None
+        self.paint_loading()
+        threading.Thread(target=self.init_backend, daemon=True).start()
+    
+    def init_backend(self):
+        """Initialize agents, environment and processors on a worker thread"""
+        try:
+            # Initialize agents
+            self.agents = initialize_agents(human_agent_ids=self.human_agent_ids, n_players=self.n_players)
+            self._agent_soa = self.create_agent_soa()
+            # Agent types are fixed for the run
+            self._human_agent_indices = tuple(int(i) for i in np.flatnonzero(self._agent_soa['is_human']))
+            self.sync_agent_soa()
+            self.publish_sidebar()
+            
+            # Initialize environment
+            self.env = crafter.Env(length=self.max_steps, n_players=self.n_players, seed=4)
+            self.env.reset()
+            self.env.render_all(self.game_area_size, out=self._env_buffers[self._buf_idx].transpose(0, 2, 1, 3))
+            
+            # Initialize processors
+            self.action_processor = AgentActionProcessor()
+            self.env_manager = EnvironmentManager()
+            self.reporter = SimulationLogger()
+            self.agent_state_manager = AgentStateManager()
+            self.simulation_context_manager = SimulationContextManager(self.n_players)
+            self.agent_thinking_processor = AgentThinkingProcessor()
+        except Exception as e:
+            self._backend_error = e
+        finally:
+            self._backend_ready.set()
+    
+    def create_agent_soa(self):
+        """Create parallel arrays holding the per-agent fields the GUI reads every frame"""
+        # Strings (op, resources) are interned to ids; -1 means unset
+        self._soa_strings = []
+        self._soa_string_ids = {}
+        return {
+            'is_human': np.array([getattr(agent, 'is_human', False) for agent in self.agents], dtype=bool),
+            'action_status': np.empty(self.n_players, dtype=np.int32),
+            'op_id': np.full(self.n_players, -1, dtype=np.int32),
+            'rss_collect_id': np.full(self.n_players, -1, dtype=np.int32),
+            'rss_share_id': np.full(self.n_players, -1, dtype=np.int32),
+            'target_id': np.full(self.n_players, -1, dtype=np.int32)
+        }
+    
+    def _string_id(self, value):
+        """Return the interned id of a string field, or -1 when it is empty"""
+        if not value:
+            return -1
+        string_id = self._soa_string_ids.get(value)
+        if string_id is None:
+            string_id = len(self._soa_strings)
+            self._soa_strings.append(value)
+            self._soa_string_ids[value] = string_id
+        return string_id
+    
+    def sync_agent_soa(self):
+        """Write the agents' current state back into the SoA arrays"""
+        soa = self._agent_soa
+        for agent in self.agents:
+            i = agent.id
+            soa['action_status'][i] = agent.action_status.value
+            soa['op_id'][i] = self._string_id(agent.op)
+            soa['rss_collect_id'][i] = self._string_id(agent.rss_to_collect)
+            soa['rss_share_id'][i] = self._string_id(agent.rss_to_share)
+            soa['target_id'][i] = agent.target_agent_id
+    
+    def paint_loading(self):
+        """Paint the loading splash shown until the backend is ready"""
+        self.screen.fill(self.colors['black'])
+        loading_text = self._text('Loading agents and environment...', 'large', self.colors['white'])
+        self.screen.blit(loading_text, loading_text.get_rect(center=self.screen.get_rect().center))
+        pygame.display.flip()
+    
+    def wait_for_backend(self):
+        """Keep the splash responsive while the backend initializes"""
+        while self.running and not self._backend_ready.is_set():
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                    self.running = False
+            self.paint_loading()
+            self.clock.tick(self.render_fps)
+        
+        if self._backend_error is not None:
+            raise self._backend_error
     
     def create_buttons(self):
         """Create UI buttons"""
@@ -139,10 +318,15 @@ class MultiViewGUI:
                 'hover_color': self.colors['orange']
             }
         
-        # Agent follow buttons
+        # Agent follow buttons, laid out on a regular grid that clicks are resolved against
+        self._button_grid_origin = (610, 700)
+        self._button_grid_pitch = (60, 35)
+        self._button_grid = {}
         for i in range(min(self.n_players, 10)):
-            x = 610 + (i % 5) * 60
-            y = 700 + (i // 5) * 35
+            col, row = i % 5, i // 5
+            x = self._button_grid_origin[0] + col * self._button_grid_pitch[0]
+            y = self._button_grid_origin[1] + row * self._button_grid_pitch[1]
+            self._button_grid[(col, row)] = f'follow_agent_{i}'
             buttons[f'follow_agent_{i}'] = {
                 'rect': pygame.Rect(x, y, 50, 25),
                 'text': f'Agent {i}',
@@ -167,57 +351,160 @@ class MultiViewGUI:
                 'hover_color': self.colors['orange']
             }
         
+        # Pre-bake button labels, they never change
+        for button in buttons.values():
+            button['text_surface'] = self._text(button['text'], 'small', self.colors['black'])
+            button['text_rect'] = button['text_surface'].get_rect(center=button['rect'].center)
+        
+        # Clicks outside this box cannot hit any button
+        rects = [button['rect'] for button in buttons.values()]
+        self._buttons_bounds = rects[0].unionall(rects[1:])
+        # View and control rows are few and irregular, so they are scanned
+        self._scanned_button_ids = [button_id for button_id in buttons if button_id not in self._button_grid.values()]
+        
         return buttons
     
+    def create_sidebar_background(self):
+        """Draw the sidebar parts that never change onto a transparent surface"""
+        sidebar_bg = pygame.Surface((self.sidebar_width, self.window_size[1]), pygame.SRCALPHA)
+        
+        # Title
+        sidebar_bg.blit(self._text('Multi-View GUI', 'large', self.colors['white']), (10, 10))
+        
+        # Progress bar background and border
+        pygame.draw.rect(sidebar_bg, self.colors['dark_gray'], self.progress_bar_rect)
+        pygame.draw.rect(sidebar_bg, self.colors['white'], self.progress_bar_rect, 1)
+        
+        # Agent status label
+        sidebar_bg.blit(self._text('Agent Status:', 'normal', self.colors['yellow']),
+                        (10, self.progress_bar_rect.y + 40))
+        
+        return sidebar_bg.convert_alpha()
+    
+    def create_help_overlay(self):
+        """Draw the dimmed background and all help lines onto one translucent surface"""
+        help_overlay = pygame.Surface(self.window_size, pygame.SRCALPHA)
+        help_overlay.fill((0, 0, 0, 128))
+        
+        y = 150
+        for line in self.help_lines + ['', 'Click Help again to close']:
+            help_overlay.blit(self._text(line, 'medium', self.colors['white']), (50, y))
+            y += 30
+        
+        return help_overlay.convert_alpha()
+    
+    def _text(self, text, font_key, color):
+        """Return the rendered surface for a string, rasterizing it only on first use"""
+        key = (text, font_key, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self.fonts[font_key].render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
+    
     def render(self):
         """Render the game state"""
+        if self._background_dirty:
+            self._background_dirty = False
+            self._dirty_rects.extend(self.render_static_background())
+        else:
+            self.screen.blit(self._background, (0, 0))
+        
+        # Help overlay is pre-baked, so showing it costs a single blit
+        if self.show_help:
+            self.screen.blit(self._help_overlay_surface, (0, 0))
+        
+        # Render input interface if in input mode
+        if self.input_mode:
+            self._dirty_rects.extend(self.render_input_interface())
+        
+        pygame.display.update(self._dirty_rects)
+        self._dirty_rects.clear()
+        self.clock.tick(self.render_fps)
+    
+    def render_static_background(self):
+        """Render views, sidebar and buttons, keep a copy for frames that only change overlays,
+        and return the screen areas that need pushing to the display"""
         # Clear screen
         self.screen.fill(self.colors['black'])
+        self._view_rects.clear()
         
         # Render based on view mode
-        if self.current_view_mode == "single":
-            self.render_single_view()
-        elif self.current_view_mode == "multi":
-            self.render_multi_view()
-        elif self.current_view_mode == "overview":
-            self.render_overview()
+        with self._frame_lock:
+            if self.current_view_mode == "single":
+                self.render_single_view()
+            elif self.current_view_mode == "multi":
+                self.render_multi_view()
+            elif self.current_view_mode == "overview":
+                self.render_overview()
+            sidebar_snapshot = self._sidebar_snapshot
         
-        # Render sidebar
-        self.render_sidebar()
+        # Render sidebar from the published snapshot, never waiting on a step
+        self.render_sidebar(*sidebar_snapshot)
         
         # Render buttons
         self.render_buttons()
         
-        # Render input interface if in input mode
-        if self.input_mode:
-            self.render_input_interface()
+        self._background.blit(self.screen, (0, 0))
         
-        pygame.display.flip()
-        self.clock.tick(self.fps)
+        if self._full_redraw:
+            self._full_redraw = False
+            return [self.screen.get_rect()]
+        return self._view_rects + self.sidebar_dynamic_rects()
+    
+    def sidebar_dynamic_rects(self):
+        """Return the sidebar areas a simulation step changes: step counter, progress fill and agent status"""
+        sidebar_left = self.window_size[0] - self.sidebar_width
+        text_width = self.sidebar_width - 10
+        status_y = self.progress_bar_rect.y + 70
+        return [
+            pygame.Rect(sidebar_left + 10, 140, text_width, self.fonts['medium'].get_linesize()),
+            self.progress_bar_rect.move(sidebar_left, 0),
+            pygame.Rect(sidebar_left + 10, status_y, text_width, 50 * self.n_players),
+        ]
+    
+    def poll_frames(self):
+        """Request a redraw when the simulation thread has published a new step"""
+        with self._frame_lock:
+            if not self._frames_updated:
+                return
+            self._frames_updated = False
+        self._dirty = True
+        self._background_dirty = True
+    
+    def publish_sidebar(self):
+        """Hand a copy of the step counter and agent arrays to the render thread"""
+        snapshot = (self.current_step, {key: values.copy() for key, values in self._agent_soa.items()})
+        with self._frame_lock:
+            self._sidebar_snapshot = snapshot
+            self._frames_updated = True
+    
+    def publish_frames(self):
+        """Render all agent views into the back buffer and swap it to the front"""
+        back_idx = 1 - self._buf_idx
+        self.env.render_all(self.game_area_size, out=self._env_buffers[back_idx].transpose(0, 2, 1, 3))
+        # The redraw is requested by the publish_sidebar call that ends the step
+        with self._frame_lock:
+            self._buf_idx = back_idx
     
     def render_single_view(self):
         """Render single agent view"""
-        # Switch to followed agent's perspective
-        self.env.switch_player(self.current_followed_agent)
-        
-        # Render environment from that agent's perspective
-        image = self.env.render(self.game_area_size)
-        surface = pygame.surfarray.make_surface(image.transpose((1, 0, 2)))
-        self.screen.blit(surface, (0, 0))
+        # Use the followed agent's perspective from the front buffer
+        view = self._view_surfaces[self._buf_idx][self.current_followed_agent]
+        self._view_rects.append(self.screen.blit(view, (0, 0)))
         
         # Render game area border
-        pygame.draw.rect(self.screen, self.colors['white'], 
-                        (0, 0, self.game_area_size[0], self.game_area_size[1]), 2)
+        self._view_rects.append(pygame.draw.rect(self.screen, self.colors['white'], 
+                        (0, 0, self.game_area_size[0], self.game_area_size[1]), 2))
         
         # Render current agent indicator
-        font = pygame.font.Font(None, 36)
-        agent_text = font.render(f'Following Agent {self.current_followed_agent}', True, self.colors['yellow'])
+        agent_text = self._text(f'Following Agent {self.current_followed_agent}', 'large', self.colors['yellow'])
         self.screen.blit(agent_text, (10, self.game_area_size[1] + 10))
     
     def render_multi_view(self):
         """Render multiple agent views"""
         # Get all agent views
-        all_views = self.env.render_all(self.game_area_size)
+        all_views = self._view_surfaces[self._buf_idx]
         
         if self.view_layout == "horizontal":
             self.render_horizontal_layout(all_views)
@@ -235,17 +522,15 @@ class MultiViewGUI:
             x = i * view_width
             y = 0
             
-            # Convert view to surface
-            surface = pygame.surfarray.make_surface(view.transpose((1, 0, 2)))
-            self.screen.blit(surface, (x, y))
+            # Copy view onto the screen
+            self._view_rects.append(self.screen.blit(view, (x, y)))
             
             # Render border
-            pygame.draw.rect(self.screen, self.colors['white'], 
-                           (x, y, view_width, view_height), 2)
+            self._view_rects.append(pygame.draw.rect(self.screen, self.colors['white'], 
+                           (x, y, view_width, view_height), 2))
             
             # Render agent label
-            font = pygame.font.Font(None, 24)
-            agent_text = font.render(f'Agent {i}', True, self.colors['yellow'])
+            agent_text = self._text(f'Agent {i}', 'medium', self.colors['yellow'])
             self.screen.blit(agent_text, (x + 5, y + 5))
     
     def render_vertical_layout(self, all_views):
@@ -257,17 +542,15 @@ class MultiViewGUI:
             x = 0
             y = i * view_height
             
-            # Convert view to surface
-            surface = pygame.surfarray.make_surface(view.transpose((1, 0, 2)))
-            self.screen.blit(surface, (x, y))
+            # Copy view onto the screen
+            self._view_rects.append(self.screen.blit(view, (x, y)))
             
             # Render border
-            pygame.draw.rect(self.screen, self.colors['white'], 
-                           (x, y, view_width, view_height), 2)
+            self._view_rects.append(pygame.draw.rect(self.screen, self.colors['white'], 
+                           (x, y, view_width, view_height), 2))
             
             # Render agent label
-            font = pygame.font.Font(None, 24)
-            agent_text = font.render(f'Agent {i}', True, self.colors['yellow'])
+            agent_text = self._text(f'Agent {i}', 'medium', self.colors['yellow'])
             self.screen.blit(agent_text, (x + 5, y + 5))
     
     def render_grid_layout(self, all_views):
@@ -284,138 +567,128 @@ class MultiViewGUI:
             x = col * view_width
             y = row * view_height
             
-            # Convert view to surface
-            surface = pygame.surfarray.make_surface(view.transpose((1, 0, 2)))
-            self.screen.blit(surface, (x, y))
+            # Copy view onto the screen
+            self._view_rects.append(self.screen.blit(view, (x, y)))
             
             # Render border
-            pygame.draw.rect(self.screen, self.colors['white'], 
-                           (x, y, view_width, view_height), 2)
+            self._view_rects.append(pygame.draw.rect(self.screen, self.colors['white'], 
+                           (x, y, view_width, view_height), 2))
             
             # Render agent label
-            font = pygame.font.Font(None, 20)
-            agent_text = font.render(f'Agent {i}', True, self.colors['yellow'])
+            agent_text = self._text(f'Agent {i}', 'normal', self.colors['yellow'])
             self.screen.blit(agent_text, (x + 5, y + 5))
     
     def render_overview(self):
         """Render overview of all agents"""
         # Use the first agent's view as overview
-        self.env.switch_player(0)
-        image = self.env.render(self.game_area_size)
-        surface = pygame.surfarray.make_surface(image.transpose((1, 0, 2)))
-        self.screen.blit(surface, (0, 0))
+        self._view_rects.append(self.screen.blit(self._view_surfaces[self._buf_idx][0], (0, 0)))
         
         # Render game area border
-        pygame.draw.rect(self.screen, self.colors['white'], 
-                        (0, 0, self.game_area_size[0], self.game_area_size[1]), 2)
+        self._view_rects.append(pygame.draw.rect(self.screen, self.colors['white'], 
+                        (0, 0, self.game_area_size[0], self.game_area_size[1]), 2))
         
         # Render overview label
-        font = pygame.font.Font(None, 36)
-        overview_text = font.render('Overview (Agent 0 Perspective)', True, self.colors['cyan'])
+        overview_text = self._text('Overview (Agent 0 Perspective)', 'large', self.colors['cyan'])
         self.screen.blit(overview_text, (10, self.game_area_size[1] + 10))
     
-    def render_sidebar(self):
-        """Render the sidebar with agent information"""
-        sidebar_x = self.window_size[0] - self.sidebar_width + 10
+    def render_sidebar(self, current_step, soa):
+        """Render the sidebar with agent information from a published snapshot"""
+        sidebar_left = self.window_size[0] - self.sidebar_width
+        sidebar_x = sidebar_left + 10
         
-        # Title
-        font_large = pygame.font.Font(None, 36)
-        title = font_large.render('Multi-View GUI', True, self.colors['white'])
-        self.screen.blit(title, (sidebar_x, 10))
+        # Title, progress bar frame and labels
+        self.screen.blit(self._sidebar_bg, (sidebar_left, 0))
         
         # View mode info
-        font = pygame.font.Font(None, 24)
-        view_text = font.render(f'View Mode: {self.current_view_mode}', True, self.colors['cyan'])
+        font = self.fonts['medium']
+        view_text = self._text(f'View Mode: {self.current_view_mode}', 'medium', self.colors['cyan'])
         self.screen.blit(view_text, (sidebar_x, 50))
         
         if self.current_view_mode == "single":
-            follow_text = font.render(f'Following: Agent {self.current_followed_agent}', True, self.colors['yellow'])
+            follow_text = self._text(f'Following: Agent {self.current_followed_agent}', 'medium', self.colors['yellow'])
             self.screen.blit(follow_text, (sidebar_x, 80))
         
-        layout_text = font.render(f'Layout: {self.view_layout}', True, self.colors['cyan'])
+        layout_text = self._text(f'Layout: {self.view_layout}', 'medium', self.colors['cyan'])
         self.screen.blit(layout_text, (sidebar_x, 110))
         
         # Step counter
-        step_text = font.render(f'Step: {self.current_step}/{self.max_steps}', True, self.colors['white'])
+        step_text = font.render(f'Step: {current_step}/{self.max_steps}', True, self.colors['white'])
         self.screen.blit(step_text, (sidebar_x, 140))
         
-        # Progress bar
-        progress = self.current_step / self.max_steps
-        bar_width = 300
-        bar_height = 20
-        bar_x = sidebar_x
-        bar_y = 170
-        
-        # Background
-        pygame.draw.rect(self.screen, self.colors['dark_gray'], 
-                        (bar_x, bar_y, bar_width, bar_height))
-        # Progress
-        pygame.draw.rect(self.screen, self.colors['green'], 
-                        (bar_x, bar_y, int(bar_width * progress), bar_height))
-        # Border
-        pygame.draw.rect(self.screen, self.colors['white'], 
-                        (bar_x, bar_y, bar_width, bar_height), 1)
+        # Progress fill, inside the cached border
+        progress = current_step / self.max_steps
+        bar = self.progress_bar_rect.move(sidebar_left, 0).inflate(-2, -2)
+        bar.width = int(bar.width * progress)
+        pygame.draw.rect(self.screen, self.colors['green'], bar)
         
         # Agent status
-        self.render_agent_status(sidebar_x, bar_y + 40)
+        self.render_agent_status(sidebar_x, self.progress_bar_rect.y + 40, soa)
         
         # Status indicators
         self.render_status_indicators(sidebar_x, 500)
     
-    def render_agent_status(self, x, y):
-        """Render agent status information"""
-        font = pygame.font.Font(None, 20)
-        title = font.render('Agent Status:', True, self.colors['yellow'])
-        self.screen.blit(title, (x, y))
-        
+    def render_agent_status(self, x, y, soa):
+        """Render agent status information below the cached 'Agent Status:' label"""
         y_offset = y + 30
-        for i, agent in enumerate(self.agents):
+        for i in range(self.n_players):
             # Agent type and status
-            agent_type = "Human" if hasattr(agent, 'is_human') and agent.is_human else "AI"
-            status = "Waiting" if agent.action_status == ActionStatus.DONE else "Working"
-            color = self.colors['yellow'] if hasattr(agent, 'is_human') and agent.is_human else self.colors['white']
+            is_human = soa['is_human'][i]
+            agent_type = "Human" if is_human else "AI"
+            status = "Waiting" if soa['action_status'][i] == ActionStatus.DONE.value else "Working"
+            color = self.colors['yellow'] if is_human else self.colors['white']
             
             # Highlight current followed agent
             if self.current_view_mode == "single" and i == self.current_followed_agent:
                 color = self.colors['cyan']
             
-            agent_text = font.render(f'Agent {i} ({agent_type}): {status}', True, color)
-            self.screen.blit(agent_text, (x, y_offset))
-            
-            # Current operation
-            if hasattr(agent, 'op') and agent.op:
-                op_text = font.render(f'  Op: {agent.op}', True, self.colors['light_gray'])
-                self.screen.blit(op_text, (x + 10, y_offset + 20))
+            op_id = soa['op_id'][i]
+            op = self._soa_strings[op_id] if op_id >= 0 else None
+            key = (agent_type, status, color, op)
+            cached = self._agent_status_cache.get(i)
+            if cached is None or cached[0] != key:
+                cached = (key, self.render_agent_status_entry(i, agent_type, status, color, op))
+                self._agent_status_cache[i] = cached
+            self.screen.blit(cached[1], (x, y_offset))
             
             y_offset += 50
     
+    def render_agent_status_entry(self, i, agent_type, status, color, op):
+        """Rasterize the status and operation lines of one agent onto a transparent surface"""
+        font = self.fonts['normal']
+        entry = pygame.Surface((self.sidebar_width - 10, 50), pygame.SRCALPHA)
+        
+        agent_text = font.render(f'Agent {i} ({agent_type}): {status}', True, color)
+        entry.blit(agent_text, (0, 0))
+        
+        # Current operation
+        if op:
+            op_text = font.render(f'  Op: {op}', True, self.colors['light_gray'])
+            entry.blit(op_text, (10, 20))
+        
+        return entry.convert_alpha()
+    
     def render_status_indicators(self, x, y):
         """Render status indicators"""
-        font = pygame.font.Font(None, 20)
-        
         # Pause indicator
         if self.paused:
-            pause_text = font.render('PAUSED - Press P to resume', True, self.colors['red'])
+            pause_text = self._text('PAUSED - Press P to resume', 'normal', self.colors['red'])
             self.screen.blit(pause_text, (x, y))
         
         # Input mode indicator
         if self.input_mode:
-            input_text = font.render('INPUT MODE - Type your response', True, self.colors['green'])
+            input_text = self._text('INPUT MODE - Type your response', 'normal', self.colors['green'])
             self.screen.blit(input_text, (x, y + 25))
         
         # Current human agent
         if self.current_human_agent is not None:
-            current_text = font.render(f'Current Human Agent: {self.current_human_agent}', True, self.colors['orange'])
+            current_text = self._text(f'Current Human Agent: {self.current_human_agent}', 'normal', self.colors['orange'])
             self.screen.blit(current_text, (x, y + 50))
     
     def render_buttons(self):
         """Render UI buttons"""
-        font = pygame.font.Font(None, 18)
-        mouse_pos = pygame.mouse.get_pos()
-        
         for button_id, button in self.buttons.items():
             # Check hover
-            color = button['hover_color'] if button['rect'].collidepoint(mouse_pos) else button['color']
+            color = button['hover_color'] if button_id == self._hovered_button_id else button['color']
             
             # Highlight current view mode
             if button_id == f'{self.current_view_mode}_view':
@@ -430,35 +703,50 @@ class MultiViewGUI:
             pygame.draw.rect(self.screen, self.colors['white'], button['rect'], 2)
             
             # Draw text
-            text = font.render(button['text'], True, self.colors['black'])
-            text_rect = text.get_rect(center=button['rect'].center)
-            self.screen.blit(text, text_rect)
+            self.screen.blit(button['text_surface'], button['text_rect'])
     
     def render_input_interface(self):
-        """Render input interface overlay"""
+        """Render input interface overlay and return the screen areas whose content changes"""
         # Semi-transparent overlay
-        overlay = pygame.Surface(self.window_size)
-        overlay.set_alpha(128)
-        overlay.fill(self.colors['black'])
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._dim_overlay, (0, 0))
         
-        font = pygame.font.Font(None, 24)
+        font = self.fonts['medium']
         
         # Input prompt
-        prompt_text = font.render(self.input_prompt, True, self.colors['white'])
+        prompt_text = self._text(self.input_prompt, 'medium', self.colors['white'])
         self.screen.blit(prompt_text, (50, 200))
         
         # Input field
+        self.input_field = "".join(self._input_buf)
         input_text = font.render(f'Input: {self.input_field}', True, self.colors['yellow'])
         self.screen.blit(input_text, (50, 230))
         
         # Instructions
-        instruction_text = font.render('Press ENTER to confirm, ESC to cancel', True, self.colors['light_gray'])
+        instruction_text = self._text('Press ENTER to confirm, ESC to cancel', 'medium', self.colors['light_gray'])
         self.screen.blit(instruction_text, (50, 260))
+        
+        # Full-width strip over the text lines, so shortened input is cleared too
+        return [pygame.Rect(0, 200, self.window_size[0], 260 + instruction_text.get_height() - 200)]
     
     def handle_events(self):
         """Handle pygame events"""
         for event in pygame.event.get():
+            if event.type == pygame.MOUSEMOTION:
+                # Only a change of hovered button needs a redraw
+                hovered = next((button_id for button_id, button in self.buttons.items()
+                                if button['rect'].collidepoint(event.pos)), None)
+                if hovered != self._hovered_button_id:
+                    # Push just the buttons entering and leaving the hover state
+                    for button_id in (self._hovered_button_id, hovered):
+                        if button_id is not None:
+                            self._dirty_rects.append(self.buttons[button_id]['rect'])
+                    self._hovered_button_id = hovered
+                    self._dirty = True
+                    self._background_dirty = True
+                continue
+            
+            was_input_mode = self.input_mode
+            
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
@@ -466,9 +754,17 @@ class MultiViewGUI:
                     self.handle_input_event(event)
                 else:
                     self.handle_normal_event(event)
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left click
-                    self.handle_mouse_click(event.pos)
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left click
+                self.handle_mouse_click(event.pos)
+            else:
+                # KEYUP, TEXTINPUT, other buttons and window events change nothing drawn
+                continue
+            
+            self._dirty = True
+            # Keystrokes that stay within input mode only change the overlay
+            if not (event.type == pygame.KEYDOWN and was_input_mode and self.input_mode):
+                self._background_dirty = True
+                self._full_redraw = True
     
     def handle_normal_event(self, event):
         """Handle events when not in input mode"""
@@ -499,22 +795,35 @@ class MultiViewGUI:
             # Cancel input
             self.input_mode = False
             self.input_field = ""
+            self._input_buf.clear()
             self.input_type = ""
         elif event.key == pygame.K_RETURN:
             # Confirm input
             self.process_input()
         elif event.key == pygame.K_BACKSPACE:
             # Delete character
-            self.input_field = self.input_field[:-1]
+            if self._input_buf:
+                self._input_buf.pop()
         else:
             # Add character
             if event.unicode.isprintable():
-                self.input_field += event.unicode
+                self._input_buf.append(event.unicode)
     
     def handle_mouse_click(self, pos):
         """Handle mouse clicks on buttons"""
-        for button_id, button in self.buttons.items():
-            if button['rect'].collidepoint(pos):
+        if not self._buttons_bounds.collidepoint(pos):
+            return
+        
+        # Agent follow buttons: find the grid cell arithmetically
+        col = (pos[0] - self._button_grid_origin[0]) // self._button_grid_pitch[0]
+        row = (pos[1] - self._button_grid_origin[1]) // self._button_grid_pitch[1]
+        button_id = self._button_grid.get((col, row))
+        if button_id is not None and self.buttons[button_id]['rect'].collidepoint(pos):
+            self.handle_button_action(button_id)
+            return
+        
+        for button_id in self._scanned_button_ids:
+            if self.buttons[button_id]['rect'].collidepoint(pos):
                 self.handle_button_action(button_id)
                 break
     
@@ -524,6 +833,8 @@ class MultiViewGUI:
             self.paused = not self.paused
         elif button_id == 'human_action':
             self.start_human_action_selection()
+        elif button_id == 'help':
+            self.show_help = not self.show_help
         elif button_id == 'single_view':
             self.current_view_mode = "single"
         elif button_id == 'multi_view':
@@ -559,31 +870,32 @@ class MultiViewGUI:
     
     def start_human_action_selection(self):
         """Start human agent action selection process"""
-        human_agents = [i for i, agent in enumerate(self.agents) 
-                       if hasattr(agent, 'is_human') and agent.is_human]
-        
-        if not human_agents:
+        if not self._human_agent_indices:
             print("No human agents available")
             return
         
         if self.current_human_agent is None:
-            self.current_human_agent = human_agents[0]
+            self.current_human_agent = self._human_agent_indices[0]
         
         # Start input sequence
         self.input_mode = True
         self.input_type = 'op'
         self.input_prompt = f"Human Agent {self.current_human_agent} - Enter operation type (Navigator/share/noop/etc):"
         self.input_field = ""
+        self._input_buf.clear()
+        self._human_skill_draft = []
     
     def process_input(self):
         """Process the current input"""
+        self.input_field = "".join(self._input_buf)
+        self._input_buf.clear()
         if self.input_type == 'op':
             op = self.input_field.strip()
             if not op:
                 op = 'noop'
             
             # Store operation and move to next input
-            self.agents[self.current_human_agent].op = op
+            self._human_skill_draft.append(op)
             self.input_type = 'collect'
             self.input_prompt = f"Enter resource to collect (or 'not_applicable'):"
             self.input_field = ""
@@ -594,7 +906,7 @@ class MultiViewGUI:
                 rss_to_collect = 'not_applicable'
             
             # Store collect resource and move to next input
-            self.agents[self.current_human_agent].rss_to_collect = rss_to_collect
+            self._human_skill_draft.append(rss_to_collect)
             self.input_type = 'share'
             self.input_prompt = f"Enter resource to share (or 'not_applicable'):"
             self.input_field = ""
@@ -605,7 +917,7 @@ class MultiViewGUI:
                 rss_to_share = 'not_applicable'
             
             # Store share resource and move to next input
-            self.agents[self.current_human_agent].rss_to_share = rss_to_share
+            self._human_skill_draft.append(rss_to_share)
             self.input_type = 'target'
             self.input_prompt = f"Enter target agent id (or -1 if not applicable):"
             self.input_field = ""
@@ -616,14 +928,13 @@ class MultiViewGUI:
             except ValueError:
                 target_agent_id = -1
             
-            # Store target agent and complete input
-            self.agents[self.current_human_agent].target_agent_id = target_agent_id
+            # Hand the completed skill to the sim thread, which owns the agents
+            op, rss_to_collect, rss_to_share = self._human_skill_draft
+            self._human_skill_updates.append(
+                (self.current_human_agent, op, rss_to_collect, rss_to_share, target_agent_id)
+            )
             
-            # Update agent skills
-            agent = self.agents[self.current_human_agent]
-            agent.update_current_skill(agent.op, agent.rss_to_collect, agent.rss_to_share, target_agent_id)
-            
-            print(f"[Human Agent {self.current_human_agent}] Action set: op={agent.op}, collect={agent.rss_to_collect}, share={agent.rss_to_share}, target_agent_id={target_agent_id}")
+            print(f"[Human Agent {self.current_human_agent}] Action set: op={op}, collect={rss_to_collect}, share={rss_to_share}, target_agent_id={target_agent_id}")
             
             # Exit input mode
             self.input_mode = False
@@ -635,39 +946,100 @@ class MultiViewGUI:
         if self.paused or self.input_mode:
             return
         
-        # Process agent actions
-        self.action_processor.process_all_agent_actions(self.agents, self.env, self.n_players)
+        # Bind hot attributes to locals once per step
+        agents = self.agents
+        env = self.env
+        n_players = self.n_players
+        action_processor = self.action_processor
+        env_manager = self.env_manager
+        agent_state_manager = self.agent_state_manager
+        agent_thinking_processor = self.agent_thinking_processor
+        
+        # Apply each agent's thought once it has arrived and report exactly
+        # the agents whose responses were applied
+        pending_futures = self._pending_futures
+        done_ids = [agent_id for agent_id, future in pending_futures.items() if future.done()]
+        if done_ids:
+            agents_responses = [pending_futures.pop(agent_id).result() for agent_id in done_ids]
+            agent_thinking_processor.update_agents_from_responses(agents, agents_responses)
+            
+            agents_with_new_thought = [False] * n_players
+            for response in agents_responses:
+                agents_with_new_thought[response['id']] = response['thoughts'] is not None
+            self.reporter.show_step_report(agents, agents_with_new_thought)
+        
+        # Process agent actions; agents still waiting on a thought idle
+        pending_agent_ids = frozenset(pending_futures)
+        action_processor.process_all_agent_actions(agents, env, n_players, pending_agent_ids)
         
         # Collect actions
-        agents_actions = self.action_processor.collect_agent_actions(self.agents, self.n_players)
+        agents_actions = action_processor.collect_agent_actions(agents, n_players)
         
         # Step environment
-        obs, rewards, done, info = self.env_manager.step_environment(self.env, agents_actions)
-        self.env_manager.update_crafting_stations(self.agents, self.env)
+        obs, rewards, done, info = env_manager.step_environment(env, agents_actions)
+        env_manager.update_crafting_stations(agents, env)
+        self.publish_frames()
         
-        # Update agent states
-        self.agent_state_manager.update_all_agent_states(
-            self.agents, obs, self.current_step, self.env, info, episode_number=0
+        # Update agent states, leaving the step/obs of agents being thought about untouched
+        agent_state_manager.update_all_agent_states(
+            [agent for agent in agents if agent.id not in pending_agent_ids],
+            obs, self.current_step, env, info, episode_number=0
         )
         
-        # Process agent thinking
-        agents_with_new_thought = self.agent_state_manager.identify_agents_needing_thought(self.agents, info)
-        agents_contexts = self.simulation_context_manager.create_agent_contexts(self.agents, info)
-        agents_responses = self.agent_thinking_processor.process_agent_thinking_parallel(
-            self.agents, agents_contexts, info
-        )
-        self.agent_thinking_processor.update_agents_from_responses(self.agents, agents_responses)
+        # Dispatch thinking for AI agents that need it and are not already
+        # waiting on a thought, without waiting for the result
+        agents_with_new_thought = agent_state_manager.identify_agents_needing_thought(agents, info)
+        needed_agents = [agent for agent in agents
+                         if agents_with_new_thought[agent.id] and agent.id not in pending_agent_ids
+                         and not getattr(agent, 'is_human', False)]
+        if needed_agents:
+            agents_contexts = self.simulation_context_manager.create_agent_contexts(
+                agents, info, waiting_agent_ids=pending_agent_ids
+            )
+            for agent in needed_agents:
+                pending_futures[agent.id] = self._thinking_pool.submit(
+                    Agent.process_agent, agent, agents_contexts, info
+                )
         
-        # Show step report
-        self.reporter.show_step_report(self.agents, agents_with_new_thought)
+        self.sync_agent_soa()
         
         self.current_step += 1
+        self.publish_sidebar()
         
         # Check if simulation is done
         if done or self.current_step >= self.max_steps:
             print("Simulation completed!")
             self.running = False
     
+    def apply_human_skill_updates(self):
+        """Apply skills entered through the input dialog, between steps"""
+        if not self._human_skill_updates:
+            return
+        while self._human_skill_updates:
+            agent_id, op, rss_to_collect, rss_to_share, target_agent_id = self._human_skill_updates.popleft()
+            self.agents[agent_id].update_current_skill(op, rss_to_collect, rss_to_share, target_agent_id)
+        self.sync_agent_soa()
+        self.publish_sidebar()
+    
+    def simulation_loop(self):
+        """Step the simulation at a fixed interval on a background thread"""
+        # fps <= 0 leaves stepping uncapped, as clock.tick(0) did
+        step_interval = 1.0 / self.fps if self.fps > 0 else 0.0
+        next_step_time = time.monotonic()
+        try:
+            while self.running:
+                self.apply_human_skill_updates()
+                now = time.monotonic()
+                if self.paused or self.input_mode or now < next_step_time:
+                    time.sleep(0.01)
+                    continue
+                next_step_time = now + step_interval
+                self.run_simulation_step()
+        except Exception as e:
+            # Stop the main loop too; run() re-raises once the thread has exited
+            self._sim_error = e
+            self.running = False
+    
     def run(self):
         """Main simulation loop"""
         print(f"Starting Multi-View GUI with {self.n_players} agents")
@@ -675,13 +1047,31 @@ class MultiViewGUI:
         print("Press 'h' for human actions, 'p' to pause/resume, 'v' to switch view, 'l' to switch layout")
         print("Press 0-9 to follow specific agent, ESC to quit")
         
+        self.wait_for_backend()
+        if not self.running:
+            pygame.quit()
+            print("Multi-View GUI closed")
+            return
+        
+        self._sim_thread = threading.Thread(target=self.simulation_loop, daemon=True)
+        self._sim_thread.start()
+        
         while self.running:
             self.handle_events()
-            self.run_simulation_step()
-            self.render()
+            self.poll_frames()
+            if self._dirty:
+                self._dirty = False
+                self.render()
+            else:
+                self.clock.tick(self.render_fps)
         
+        self._sim_thread.join()
+        self._thinking_pool.shutdown(wait=False)
         pygame.quit()
         print("Multi-View GUI closed")
+        
+        if self._sim_error is not None:
+            raise self._sim_error
 
 
 def main():
@@ -693,7 +1083,7 @@ def main():
     parser.add_argument('--step_num', type=int, default=350,
                         help='Number of steps (default: 350)')
     parser.add_argument('--fps', type=int, default=5,
-                        help='FPS for GUI (default: 5)')
+                        help='Simulation steps per second (default: 5)')
     
     args = parser.parse_args()
     
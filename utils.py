@@ -16,10 +16,16 @@ import numpy as np
 class AgentActionProcessor:
     """Handles agent action processing"""
     
+    # Action name -> index into const.actions, avoids a list scan per agent per step
+    _action_ids = {action: i for i, action in enumerate(const.actions)}
+    
     @staticmethod
-    def process_all_agent_actions(agents, env, n_players):
-        """Process actions for all agents with different operation types"""
+    def process_all_agent_actions(agents, env, n_players, waiting_agent_ids=()):
+        """Process actions for all agents with different operation types; agents waiting on a thought idle"""
         for agent in agents:
+            if agent.id in waiting_agent_ids:
+                agent.update_action('noop')
+                continue
             AgentActionProcessor._process_single_agent_action(agent, agents, env, n_players)
     
     @staticmethod
@@ -79,7 +85,7 @@ class AgentActionProcessor:
         """Collect all agents' actions for environment stepping"""
         agents_actions = [0] * n_players      
         for agent in agents:
-            agents_actions[agent.id] = const.actions.index(agent.action)
+            agents_actions[agent.id] = AgentActionProcessor._action_ids[agent.action]
         return agents_actions
 
 
@@ -434,11 +440,13 @@ class SimulationContextManager:
     def __init__(self, n_players):
         self.context_generator = CollaborationContextGenerator(n_players)
     
-    def create_agent_contexts(self, agents, info):
-        """Create contexts for all agents that need to think"""
+    def create_agent_contexts(self, agents, info, waiting_agent_ids=()):
+        """Create contexts for all agents that need to think; agents waiting on a thought keep their experience"""
         agents_contexts = {}
         # agents_with_new_thought = [False] * len(agents)
         for agent in agents:
+            if agent.id in waiting_agent_ids:
+                continue
             context = agent.create_experience()
             print(f"agent_{agent.id}", agent.wm_content)
             